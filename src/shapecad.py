@@ -1,16 +1,23 @@
 # -*- coding: utf-8 -*-
 
-__version__ = "2.1.0"
+__version__ = "2.2.0"
 __author__ = "Daniel Adi Nugroho"
 __email__ = "dnugroho@gmail.com"
 __status__ = "Production"
-__date__ = "2025-06-04"
+__date__ = "2026-10-15"
 __copyright__ = "Copyright (c) 2025 Daniel Adi Nugroho"
 __license__ = "GNU General Public License v3.0 (GPL-3.0)"
 
 # Version History
 # --------------
 
+# 2.2.0 (2026-10-15)
+# - DXF R12 output for legacy CAD software (point layers streamed to disk)
+# - Large shapefiles converted in batches to keep memory use bounded
+# - Faster shapefile reading and writing with pyogrio/pyarrow when installed
+# - Shapefile analysis runs in the background without blocking the interface
+# - Requires shapely 2.0 or newer
+
 # 2.1.0 (2025-06-04)
 # - Automatic geometry type detection for SHP → DXF conversion
 # - Coordinate Reference System (CRS) detection and display
@@ -66,9 +73,13 @@ Requirements:
   - geopandas: for spatial data handling
   - ezdxf: for DXF file processing
   - shapely: for geometry operations
+  - numpy: for coordinate array handling
   - logging: for error tracking and debugging
   - pathlib: for path handling
   - threading: for non-blocking operations
+- Optional packages:
+  - pyogrio: for faster shapefile reading and writing
+  - pyarrow: for batched (Arrow) shapefile reading and writing with pyogrio
 
 Features:
 ---------
@@ -83,7 +94,7 @@ Features:
    - Real-time coordinate reference system analysis
    - Australian CRS recognition and validation
    - Support for Point, LineString, and Polygon geometries
-   - Binary and ASCII DXF output formats
+   - Binary and ASCII DXF output formats (R12 point layers are streamed to disk)
 
 3. Coordinate System Support:
    - GDA1994 MGA Zones 50-56 (EPSG:28350-28356)
@@ -133,8 +144,10 @@ Australian MGA Zone Coverage:
 Technical Notes:
 ---------------
 - DXF files do not contain coordinate reference system information
+- Z values of 3D shapefile lines/polygons are kept using DXF 3D POLYLINE entities
 - Always document the coordinate system used when sharing DXF files
 - Log files are created with pattern: converter_YYYYMMDD.log
+- Set SHAPECAD_DEBUG=1 in the environment for detailed per-entity debug logging
 - All operations are performed in separate threads to prevent UI freezing
 - Comprehensive error handling and user feedback throughout
 
@@ -157,32 +170,70 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
 # Core imports
-print("Core imports starts.")
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-print("Tkinter imports finished.")
-import os, sys, datetime, threading, logging
-import platform, subprocess, datetime
-print("System imports finished.")
+import os, sys, datetime, threading, logging, stat
+import platform, subprocess, datetime, math, re
 from pathlib import Path
-print("Pathlib imports finished.")
 from datetime import datetime
+from functools import lru_cache
+from contextlib import contextmanager
+import importlib.util
 
 # Geospatial processing imports
-print("Geospatial imports starts.")
-import geopandas as gpd
-import ezdxf
-from shapely.geometry import Point, LineString, Polygon
-print("Geospatial imports finished.")
-print("All imports finished.")
+import numpy as np
+# geopandas, ezdxf and shapely are imported where they are used, so they
+# are only loaded once a shapefile is analysed or a conversion runs
+
+# Optional: pyogrio reads and writes shapefiles through vectorized GDAL
+# calls (older geopandas versions default to Fiona), and with pyarrow
+# features are transferred in Arrow record batches instead of one at a time.
+# Only their presence is checked here; they are loaded through geopandas.
+PYOGRIO_AVAILABLE = importlib.util.find_spec('pyogrio') is not None
+ARROW_IO_AVAILABLE = PYOGRIO_AVAILABLE and importlib.util.find_spec('pyarrow') is not None
+
+
+def load_geopandas():
+    """Import geopandas on first use, with pyogrio as its default I/O engine when available"""
+    import geopandas as gpd
+    
+    # Make pyogrio the default for every read_file/to_file call in this module
+    # (geopandas versions without the io_engine option keep their default)
+    if PYOGRIO_AVAILABLE and hasattr(gpd.options, 'io_engine'):
+        gpd.options.io_engine = "pyogrio"
+    return gpd
+
+
+def check_shapely_version():
+    """
+    Fail early with a clear message if the installed shapely is older than 2.0
+    
+    The conversions use the vectorized shapely 2 API (get_coordinates,
+    get_type_id, linestrings/linearrings with indices), which shapely 1.x
+    lacks. The version is read from the package metadata so shapely itself
+    is still only imported when it is first used.
+    """
+    from importlib.metadata import version, PackageNotFoundError
+    try:
+        shapely_version = version('shapely')
+    except PackageNotFoundError:
+        # Bundled builds may not ship package metadata
+        import shapely
+        shapely_version = shapely.__version__
+    
+    if int(shapely_version.split('.')[0]) < 2:
+        raise RuntimeError(f"shapely>=2.0 required (installed: {shapely_version}). "
+                           f"Please upgrade with: pip install \"shapely>=2.0\"")
 
 
 # Configure enhanced logging with timestamp and better formatting
 def setup_logging():
     """Set up logging configuration with rotating file handler"""
     log_filename = f"converter_{datetime.now().strftime('%Y%m%d')}.log"
+    # Per-entity debug messages are only emitted when SHAPECAD_DEBUG=1 is set
+    debug_enabled = os.environ.get('SHAPECAD_DEBUG') == '1'
     logging.basicConfig(
-        level=logging.INFO,
+        level=logging.DEBUG if debug_enabled else logging.INFO,
         format='%(asctime)s - %(levelname)s - %(funcName)s - %(message)s',
         handlers=[
             logging.FileHandler(log_filename, encoding='utf-8'),
@@ -204,20 +255,91 @@ class Config:
     # Supported MGA zones for Australia
     SUPPORTED_ZONES = ["50", "51", "52", "53", "54", "55", "56"]
     
+    # Australian EPSG codes -> (datum, projection, zone), built below the
+    # class from the base EPSG codes above
+    AUSTRALIAN_EPSG_CODES = {}
+    
+    # Detected CRS display, keyed by (is_australian, is_mga, has_epsg):
+    # (CRS label template, style, details label template, style). The
+    # templates are filled in from the detected crs_info dict
+    CRS_DISPLAY_TEMPLATES = {
+        (True, True, True): (
+            "✓ {datum} MGA Zone {zone}", 'Success.TLabel',
+            "Datum: {datum} | Projection: {projection} | Zone: {zone} | EPSG: {epsg_code}", 'Success.TLabel'),
+        (True, True, False): (
+            "✓ {datum} MGA Zone {zone}", 'Success.TLabel',
+            "Datum: {datum} | Projection: {projection} | Zone: {zone}", 'Success.TLabel'),
+        (True, False, True): (
+            "✓ {datum} ({projection})", 'Success.TLabel',
+            "Datum: {datum} | Projection: {projection} | EPSG: {epsg_code}", 'Info.TLabel'),
+        (True, False, False): (
+            "✓ {datum} ({projection})", 'Success.TLabel',
+            "Datum: {datum} | Projection: {projection}", 'Info.TLabel'),
+        (False, False, True): (
+            "⚠ Non-Australian (EPSG:{epsg_code})", 'Info.TLabel',
+            "Warning: Non-Australian coordinate system detected. "
+            "EPSG: {epsg_code}. Consider reprojecting to Australian datum.", 'Info.TLabel'),
+        (False, False, False): (
+            "⚠ Non-Australian CRS", 'Info.TLabel',
+            "Warning: Non-Australian coordinate system detected. "
+            "Consider reprojecting to GDA1994 or GDA2020 MGA.", 'Info.TLabel')
+    }
+    
     # Entity types that can be converted
     SUPPORTED_ENTITY_TYPES = ["Points", "Lines", "Polygons/Areas"]
     
-    # DXF versions supported by ezdxf
-    SUPPORTED_DXF_VERSIONS = ["R2010", "R2013", "R2018", "R2021"]
+    # Shapefile geometry type written for each entity type
+    SHP_GEOMETRY_TYPES = {
+        "Points": "Point",
+        "Lines": "LineString",
+        "Polygons/Areas": "Polygon"
+    }
+    
+    # DXF entity query for each entity type (ezdxf query syntax)
+    DXF_ENTITY_QUERIES = {
+        "Points": "POINT",
+        "Lines": "LINE LWPOLYLINE POLYLINE",
+        "Polygons/Areas": "LWPOLYLINE POLYLINE CIRCLE"
+    }
+    
+    # DXF files larger than this (bytes) are streamed with iterdxf instead of
+    # being loaded into memory as a whole document
+    DXF_STREAM_THRESHOLD = 100 * 1024 * 1024
+    
+    # Shapefiles (.shp) larger than this (bytes) are converted to DXF in
+    # batches of SHP_BATCH_SIZE features read through pyogrio and pyarrow,
+    # instead of being loaded into memory as a whole
+    SHP_STREAM_THRESHOLD = 100 * 1024 * 1024
+    SHP_BATCH_SIZE = 65536
+    
+    # Step interval (ms) of the conversion progress bar animation; 20 steps
+    # a second stay smooth without waking the Tk event loop needlessly
+    PROGRESS_INTERVAL_MS = 50
+    
+    # Number of polygon vertices used to approximate a DXF CIRCLE
+    CIRCLE_SEGMENTS = 32
+    
+    # DXF versions supported by ezdxf. R12 point layers are streamed straight
+    # to disk, which is much faster for large point shapefiles
+    SUPPORTED_DXF_VERSIONS = ["R12", "R2010", "R2013", "R2018", "R2021"]
     
     # Application metadata
-    APP_VERSION = "2.1"
+    APP_VERSION = "2.2"
     APP_TITLE = "SHP ↔ DXF Converter"
     
     # File type filters for dialogs
     DXF_FILETYPES = [("DXF files", "*.dxf"), ("All files", "*.*")]
     SHP_FILETYPES = [("SHP files", "*.shp"), ("All files", "*.*")]
 
+# Every MGA zone in the EPSG registry (GDA1994 28348-28358, GDA2020 7846-7859).
+# Built after the class body, as a comprehension there cannot see the base codes
+Config.AUSTRALIAN_EPSG_CODES = {
+    4283: ('GDA1994', 'Geographic (Lat/Lon)', 'N/A'),
+    7844: ('GDA2020', 'Geographic (Lat/Lon)', 'N/A'),
+    **{Config.GDA1994_BASE_EPSG + zone: ('GDA1994', 'MGA', str(zone)) for zone in range(48, 59)},
+    **{Config.GDA2020_BASE_EPSG + zone: ('GDA2020', 'MGA', str(zone)) for zone in range(46, 60)}
+}
+
 class FileValidator:
     """Utility class for file validation and path handling"""
     
@@ -227,22 +349,21 @@ class FileValidator:
         if not filepath:
             return False, "No file path provided"
         
-        path = Path(filepath)
-        if not path.exists():
+        # One stat answers both the existence and the file type checks
+        try:
+            file_mode = os.stat(filepath).st_mode
+        except OSError:
             return False, f"File does not exist: {filepath}"
         
-        if not path.is_file():
+        if not stat.S_ISREG(file_mode):
             return False, f"Path is not a file: {filepath}"
         
-        try:
-            # Try to open file to check if it's readable
-            with open(filepath, 'rb') as f:
-                pass
-            return True, "File is valid"
-        except PermissionError:
+        # Check read permission without opening the file, which can be slow
+        # on network drives
+        if not os.access(filepath, os.R_OK):
             return False, f"Permission denied accessing file: {filepath}"
-        except Exception as e:
-            return False, f"Error accessing file: {str(e)}"
+        
+        return True, "File is valid"
     
     @staticmethod
     def validate_output_path(filepath):
@@ -250,11 +371,10 @@ class FileValidator:
         if not filepath:
             return False, "No output path provided"
         
-        path = Path(filepath)
-        parent_dir = path.parent
+        parent_dir = os.path.dirname(filepath) or "."
         
         # Check if parent directory exists and is writable
-        if not parent_dir.exists():
+        if not os.path.isdir(parent_dir):
             return False, f"Output directory does not exist: {parent_dir}"
         
         if not os.access(parent_dir, os.W_OK):
@@ -268,8 +388,7 @@ class FileValidator:
         if not filepath:
             return False, f"No file path provided"
         
-        path = Path(filepath)
-        if path.suffix.lower() != expected_ext.lower():
+        if os.path.splitext(filepath)[1].lower() != expected_ext.lower():
             return False, f"File must have {expected_ext} extension"
         
         return True, "File extension is correct"
@@ -277,6 +396,53 @@ class FileValidator:
 class GeometryDetector:
     """Class responsible for detecting geometry types and CRS information in shapefiles"""
     
+    # MGA zone number in a CRS name or WKT string (matched on upper case),
+    # compiled once for all CRS checks
+    MGA_ZONE_RE = re.compile(r'ZONE[_\s]*(\d{2})')
+    
+    # Last successful analysis as (file_key, result), so re-selecting or
+    # re-typing the same unchanged shapefile does not read it again
+    _info_cache = None
+    
+    @staticmethod
+    def shapefile_key(shp_path):
+        """
+        Identify a shapefile by path, modification time and size
+        
+        The .prj is included because it holds the CRS shown in the analysis.
+        
+        Args:
+            shp_path: Path to the shapefile
+            
+        Returns:
+            tuple: Hashable key that changes whenever the .shp or .prj changes
+        """
+        key = [os.path.abspath(shp_path)]
+        for path in (shp_path, os.path.splitext(shp_path)[0] + '.prj'):
+            try:
+                file_stat = os.stat(path)
+                key.append((file_stat.st_mtime_ns, file_stat.st_size))
+            except OSError:
+                key.append(None)
+        return tuple(key)
+    
+    @staticmethod
+    def cached_shapefile_info(shp_path):
+        """
+        Get the previous analysis of a shapefile if the file is unchanged since it was last analyzed
+        
+        Args:
+            shp_path: Path to the shapefile
+            
+        Returns:
+            dict: Result as returned by detect_shapefile_info, or None if the
+                  shapefile has not been analyzed in its current state
+        """
+        cache = GeometryDetector._info_cache
+        if cache is not None and cache[0] == GeometryDetector.shapefile_key(shp_path):
+            return dict(cache[1])
+        return None
+    
     @staticmethod
     def detect_shapefile_info(shp_path):
         """
@@ -303,22 +469,30 @@ class GeometryDetector:
         }
         
         try:
-            # Read the shapefile to examine geometry types and CRS
-            gdf = gpd.read_file(shp_path)
+            file_key = GeometryDetector.shapefile_key(shp_path)
+            cache = GeometryDetector._info_cache
+            if cache is not None and cache[0] == file_key:
+                logging.info(f"Reusing shapefile analysis: {shp_path}")
+                return dict(cache[1])
+            
+            # Read the shapefile to examine geometry types and CRS - only the
+            # geometry is needed, so no attribute columns are loaded from the .dbf
+            gpd = load_geopandas()
+            read_options = {}
+            if PYOGRIO_AVAILABLE:
+                read_options = {'engine': 'pyogrio', 'use_arrow': ARROW_IO_AVAILABLE}
+            gdf = gpd.read_file(shp_path, columns=[], **read_options)
             
             if gdf.empty:
                 result['error'] = "Shapefile contains no geometries"
                 return result
             
-            # Detect geometry type
-            geometry_counts = {}
-            total_valid = 0
-            
-            for geom in gdf.geometry:
-                if geom is not None and not geom.is_empty:
-                    geom_type = geom.geom_type
-                    geometry_counts[geom_type] = geometry_counts.get(geom_type, 0) + 1
-                    total_valid += 1
+            # Detect geometry type - counted with vectorized GeoSeries
+            # operations over the non-null, non-empty geometries
+            geometry = gdf.geometry
+            valid_geometry = geometry[geometry.notna() & ~geometry.is_empty]
+            geometry_counts = valid_geometry.geom_type.value_counts().to_dict()
+            total_valid = len(valid_geometry)
             
             if total_valid == 0:
                 result['error'] = "Shapefile contains no valid geometries"
@@ -357,6 +531,7 @@ class GeometryDetector:
             # Detect CRS information
             result['crs_info'] = GeometryDetector.detect_australian_crs(gdf.crs)
             
+            GeometryDetector._info_cache = (file_key, dict(result))
             return result
                 
         except Exception as e:
@@ -395,69 +570,39 @@ class GeometryDetector:
         }
         
         try:
-            # Get EPSG code if available
-            if hasattr(crs, 'to_epsg') and crs.to_epsg():
-                crs_info['epsg_code'] = crs.to_epsg()
-                epsg_code = crs_info['epsg_code']
-                
-                # Check for Australian GDA1994 MGA zones (EPSG 283xx)
-                if 28350 <= epsg_code <= 28356:
-                    crs_info['datum'] = 'GDA1994'
-                    crs_info['projection'] = 'MGA'
-                    crs_info['zone'] = str(epsg_code - 28300)
-                    crs_info['is_australian'] = True
-                
-                # Check for Australian GDA2020 MGA zones (EPSG 785x)
-                elif 7850 <= epsg_code <= 7856:
-                    crs_info['datum'] = 'GDA2020'
-                    crs_info['projection'] = 'MGA'
-                    crs_info['zone'] = str(epsg_code - 7800)
-                    crs_info['is_australian'] = True
-                
-                # Check for some other common Australian systems
-                elif epsg_code == 4283:
-                    crs_info['datum'] = 'GDA1994'
-                    crs_info['projection'] = 'Geographic (Lat/Lon)'
-                    crs_info['zone'] = 'N/A'
-                    crs_info['is_australian'] = True
+            # Get EPSG code if available (to_epsg() searches the PROJ
+            # database, so it is only called once)
+            epsg_code = crs.to_epsg() if hasattr(crs, 'to_epsg') else None
+            if epsg_code:
+                crs_info['epsg_code'] = epsg_code
                 
-                elif epsg_code == 7844:
-                    crs_info['datum'] = 'GDA2020'
-                    crs_info['projection'] = 'Geographic (Lat/Lon)'
-                    crs_info['zone'] = 'N/A'
+                # Australian datums, MGA zones and geographic systems
+                australian_crs = Config.AUSTRALIAN_EPSG_CODES.get(epsg_code)
+                if australian_crs:
+                    crs_info['datum'], crs_info['projection'], crs_info['zone'] = australian_crs
                     crs_info['is_australian'] = True
             
             # If EPSG lookup didn't work, try parsing the CRS string
             if not crs_info['is_australian']:
-                crs_string = str(crs).upper()
+                crs_string = crs_info['crs_string'].upper()
                 
-                # Look for GDA1994 indicators
-                if 'GDA1994' in crs_string or 'GDA94' in crs_string:
-                    crs_info['datum'] = 'GDA1994'
-                    crs_info['is_australian'] = True
+                # Look for GDA1994 / GDA2020 indicators
+                for datum, markers in (('GDA1994', ('GDA1994', 'GDA94')),
+                                       ('GDA2020', ('GDA2020', 'GDA20'))):
+                    if not any(marker in crs_string for marker in markers):
+                        continue
                     
-                    # Look for MGA zone information
-                    if 'MGA' in crs_string:
-                        crs_info['projection'] = 'MGA'
-                        # Try to extract zone number
-                        import re
-                        zone_match = re.search(r'ZONE[_\s]*(\d{2})', crs_string)
-                        if zone_match:
-                            crs_info['zone'] = zone_match.group(1)
-                
-                # Look for GDA2020 indicators
-                elif 'GDA2020' in crs_string or 'GDA20' in crs_string:
-                    crs_info['datum'] = 'GDA2020'
+                    crs_info['datum'] = datum
                     crs_info['is_australian'] = True
                     
                     # Look for MGA zone information
                     if 'MGA' in crs_string:
                         crs_info['projection'] = 'MGA'
                         # Try to extract zone number
-                        import re
-                        zone_match = re.search(r'ZONE[_\s]*(\d{2})', crs_string)
+                        zone_match = GeometryDetector.MGA_ZONE_RE.search(crs_string)
                         if zone_match:
                             crs_info['zone'] = zone_match.group(1)
+                    break
             
             logging.info(f"Detected CRS: {crs_info}")
             return crs_info
@@ -488,6 +633,54 @@ class GeometryDetector:
 class GeometryExtractor:
     """Class responsible for extracting geometries from different file formats"""
     
+    # Closed unit circle ring for CIRCLE tessellation, computed once as a
+    # (CIRCLE_SEGMENTS + 1, 2) array whose last row repeats the first
+    UNIT_CIRCLE = np.column_stack([
+        np.cos(np.linspace(0, 2 * math.pi, Config.CIRCLE_SEGMENTS + 1)),
+        np.sin(np.linspace(0, 2 * math.pi, Config.CIRCLE_SEGMENTS + 1))
+    ])
+    UNIT_CIRCLE[-1] = UNIT_CIRCLE[0]
+    
+    @staticmethod
+    def lwpolyline_xy(entity):
+        """
+        Get the vertex coordinates of an LWPOLYLINE as an array
+        
+        ezdxf currently stores LWPOLYLINE vertices as one flat float array of
+        (x, y, start_width, end_width, bulge) records, so the X/Y columns can
+        be taken as a view instead of building a tuple per vertex. That layout
+        is not public API, so the public get_points('xy') is used whenever the
+        packed array is missing or does not have that shape.
+        
+        Args:
+            entity: LWPOLYLINE entity
+        
+        Returns:
+            numpy array of shape (n, 2)
+        """
+        values = getattr(getattr(entity, 'lwpoints', None), 'values', None)
+        if values is not None:
+            values = np.asarray(values, dtype=np.float64)
+            if values.ndim == 1 and values.size % 5 == 0:
+                return values.reshape(-1, 5)[:, :2]
+        
+        return np.asarray(entity.get_points('xy'), dtype=np.float64).reshape(-1, 2)
+    
+    @staticmethod
+    def closed_ring_size(points):
+        """
+        Count the vertices of a polygon ring once it is closed
+        
+        Args:
+            points: Sequence of (x, y) vertices, closed or not
+        
+        Returns:
+            int: Number of vertices including the closing one
+        """
+        if len(points) and tuple(points[0]) == tuple(points[-1]):
+            return len(points)
+        return len(points) + 1
+    
     @staticmethod
     def extract_from_dxf(msp, entity_type):
         """
@@ -500,50 +693,117 @@ class GeometryExtractor:
         Returns:
             List of Shapely geometry objects
         """
-        geometries = []
+        logging.info(f"Extracting {entity_type} from DXF file")
+        
+        query = Config.DXF_ENTITY_QUERIES.get(entity_type)
+        if query is None:
+            logging.warning(f"Unsupported entity type requested: {entity_type}")
+            return []
+        
+        logging.info(f"DXF Analysis: Found {len(msp)} total entities")
+        
+        # Process only the DXF entity types that can provide what we're looking
+        # for; their per-type counts are logged during extraction
+        return GeometryExtractor.extract_from_entities(msp.query(query), entity_type)
+    
+    @staticmethod
+    def stream_from_dxf(dxf_path, entity_type):
+        """
+        Extract geometries by streaming modelspace entities from a DXF file
+        
+        Uses ezdxf's iterdxf add-on, which yields one entity at a time instead
+        of loading the whole document into memory.
+        
+        Args:
+            dxf_path: Path to the DXF file
+            entity_type: Type of entities to extract ('Points', 'Lines', 'Polygons/Areas')
+        
+        Returns:
+            List of Shapely geometry objects, or None if the file cannot be
+            streamed (e.g. binary DXF) and has to be read with ezdxf.readfile
+        """
+        import ezdxf
+        from ezdxf.addons import iterdxf
+        
+        query = Config.DXF_ENTITY_QUERIES.get(entity_type)
+        if query is None:
+            logging.warning(f"Unsupported entity type requested: {entity_type}")
+            return []
+        
+        try:
+            dxf = iterdxf.opendxf(dxf_path)
+        except ezdxf.DXFStructureError as e:
+            logging.info(f"DXF file cannot be streamed, reading it in full: {str(e)}")
+            return None
+        
+        logging.info(f"Streaming {entity_type} from DXF file")
+        try:
+            return GeometryExtractor.extract_from_entities(
+                dxf.modelspace(types=query.split()), entity_type
+            )
+        finally:
+            dxf.close()
+    
+    @staticmethod
+    def extract_from_entities(entities, entity_type):
+        """
+        Convert DXF entities into Shapely geometries
+        
+        Args:
+            entities: Iterable of DXF entities matching Config.DXF_ENTITY_QUERIES
+            entity_type: Type of entities to extract ('Points', 'Lines', 'Polygons/Areas')
+        
+        Returns:
+            List of Shapely geometry objects
+        """
+        import shapely
+        
+        # Geometries are built after the loop with one vectorized Shapely call:
+        # POINT locations are collected as plain (x, y) pairs, and every line
+        # or polygon ring as an (n, 2) vertex sequence, in entity order
+        point_coords = []
+        parts = []
+        # Positions of polyline polygons in parts; their validity is checked
+        # with one vectorized call after the loop
+        polygon_positions = []
         processed_count = 0
         skipped_count = 0
         entity_type_counts = {}  # Track what entity types we find
         
-        logging.info(f"Extracting {entity_type} from DXF file")
+        # Checked once, so the per-entity debug messages are not formatted
+        # at all unless DEBUG logging is on
+        debug_enabled = logging.getLogger().isEnabledFor(logging.DEBUG)
         
-        # First, let's see what entities are actually in the DXF
-        total_entities = 0
-        for entity in msp:
-            total_entities += 1
+        # Class attributes used per entity, looked up once
+        lwpolyline_xy = GeometryExtractor.lwpolyline_xy
+        closed_ring_size = GeometryExtractor.closed_ring_size
+        unit_circle = GeometryExtractor.UNIT_CIRCLE
+        
+        for entity in entities:
+            # Look up the type and DXF attribute namespace once per entity
             entity_dxf_type = entity.dxftype()
             entity_type_counts[entity_dxf_type] = entity_type_counts.get(entity_dxf_type, 0) + 1
-        
-        logging.info(f"DXF Analysis: Found {total_entities} total entities")
-        logging.info(f"Entity types found: {entity_type_counts}")
-        
-        # Now process entities based on what we're looking for
-        for entity in msp:
+            dxf = entity.dxf
             try:
-                entity_dxf_type = entity.dxftype()
-                
                 # Extract Points
                 if entity_type == "Points":
-                    if entity_dxf_type == 'POINT':
-                        # Get X, Y coordinates (ignore Z for 2D shapefile)
-                        location = entity.dxf.location
-                        point = Point(location.x, location.y)
-                        geometries.append(point)
-                        processed_count += 1
+                    # Get X, Y coordinates (ignore Z for 2D shapefile)
+                    location = dxf.location
+                    point_coords.append((location.x, location.y))
+                    processed_count += 1
+                    if debug_enabled:
                         logging.debug(f"Processed POINT at ({location.x}, {location.y})")
-                    else:
-                        skipped_count += 1
                 
                 # Extract Lines from various DXF line entities
                 elif entity_type == "Lines":
                     if entity_dxf_type == 'LINE':
                         # Simple line entity
-                        start = entity.dxf.start
-                        end = entity.dxf.end
-                        line = LineString([(start.x, start.y), (end.x, end.y)])
-                        geometries.append(line)
+                        start = dxf.start
+                        end = dxf.end
+                        parts.append(((start.x, start.y), (end.x, end.y)))
                         processed_count += 1
-                        logging.debug(f"Processed LINE from ({start.x}, {start.y}) to ({end.x}, {end.y})")
+                        if debug_enabled:
+                            logging.debug(f"Processed LINE from ({start.x}, {start.y}) to ({end.x}, {end.y})")
                     
                     elif entity_dxf_type == 'LWPOLYLINE':
                         # Check if it's closed or open
@@ -551,12 +811,12 @@ class GeometryExtractor:
                         if not is_closed:
                             # Open polyline (line)
                             try:
-                                points = [(p[0], p[1]) for p in entity.get_points('xy')]
+                                points = lwpolyline_xy(entity)
                                 if len(points) >= 2:  # Need at least 2 points for a line
-                                    line = LineString(points)
-                                    geometries.append(line)
+                                    parts.append(points)
                                     processed_count += 1
-                                    logging.debug(f"Processed open LWPOLYLINE with {len(points)} points")
+                                    if debug_enabled:
+                                        logging.debug(f"Processed open LWPOLYLINE with {len(points)} points")
                             except Exception as e:
                                 logging.warning(f"Error processing LWPOLYLINE: {e}")
                                 skipped_count += 1
@@ -568,23 +828,18 @@ class GeometryExtractor:
                         try:
                             is_closed = getattr(entity, 'is_closed', False)
                             if not is_closed:
-                                vertices = list(entity.vertices)
-                                if vertices:
-                                    points = [(vertex.dxf.location.x, vertex.dxf.location.y) 
-                                            for vertex in vertices]
-                                    if len(points) >= 2:
-                                        line = LineString(points)
-                                        geometries.append(line)
-                                        processed_count += 1
+                                # points() yields the vertex locations in one pass
+                                points = [(p.x, p.y) for p in entity.points()]
+                                if len(points) >= 2:
+                                    parts.append(points)
+                                    processed_count += 1
+                                    if debug_enabled:
                                         logging.debug(f"Processed open POLYLINE with {len(points)} points")
                             else:
                                 skipped_count += 1
                         except Exception as e:
                             logging.warning(f"Error processing POLYLINE: {e}")
                             skipped_count += 1
-                    
-                    else:
-                        skipped_count += 1
                 
                 # Extract Polygons/Areas
                 elif entity_type == "Polygons/Areas":
@@ -593,20 +848,16 @@ class GeometryExtractor:
                         is_closed = getattr(entity, 'closed', False)
                         if is_closed:
                             try:
-                                points = [(p[0], p[1]) for p in entity.get_points('xy')]
-                                if len(points) >= 3:  # Need at least 3 points for a polygon
-                                    # Close the polygon if last point doesn't equal first
-                                    if points[0] != points[-1]:
-                                        points.append(points[0])
-                                    
-                                    polygon = Polygon(points)
-                                    if polygon.is_valid:  # Only add valid polygons
-                                        geometries.append(polygon)
-                                        processed_count += 1
+                                points = lwpolyline_xy(entity)
+                                # Need at least 3 distinct points for a polygon
+                                if closed_ring_size(points) >= 4:
+                                    polygon_positions.append(len(parts))
+                                    parts.append(points)
+                                    processed_count += 1
+                                    if debug_enabled:
                                         logging.debug(f"Processed closed LWPOLYLINE with {len(points)} points")
-                                    else:
-                                        skipped_count += 1
-                                        logging.warning(f"Invalid polygon skipped: {polygon}")
+                                else:
+                                    skipped_count += 1
                             except Exception as e:
                                 logging.warning(f"Error processing closed LWPOLYLINE: {e}")
                                 skipped_count += 1
@@ -618,23 +869,15 @@ class GeometryExtractor:
                         try:
                             is_closed = getattr(entity, 'is_closed', False)
                             if is_closed:
-                                vertices = list(entity.vertices)
-                                if vertices:
-                                    points = [(vertex.dxf.location.x, vertex.dxf.location.y) 
-                                            for vertex in vertices]
-                                    if len(points) >= 3:
-                                        # Close the polygon if needed
-                                        if points[0] != points[-1]:
-                                            points.append(points[0])
-                                        
-                                        polygon = Polygon(points)
-                                        if polygon.is_valid:
-                                            geometries.append(polygon)
-                                            processed_count += 1
-                                            logging.debug(f"Processed closed POLYLINE with {len(points)} points")
-                                        else:
-                                            skipped_count += 1
-                                            logging.warning(f"Invalid polygon from POLYLINE")
+                                points = [(p.x, p.y) for p in entity.points()]
+                                if closed_ring_size(points) >= 4:
+                                    polygon_positions.append(len(parts))
+                                    parts.append(points)
+                                    processed_count += 1
+                                    if debug_enabled:
+                                        logging.debug(f"Processed closed POLYLINE with {len(points)} points")
+                                else:
+                                    skipped_count += 1
                             else:
                                 skipped_count += 1
                         except Exception as e:
@@ -644,40 +887,53 @@ class GeometryExtractor:
                     elif entity_dxf_type == 'CIRCLE':
                         # Convert circle to polygon approximation
                         try:
-                            center = entity.dxf.center
-                            radius = entity.dxf.radius
-                            # Create circle as polygon with 32 points
-                            import math
-                            points = []
-                            for i in range(32):
-                                angle = 2 * math.pi * i / 32
-                                x = center.x + radius * math.cos(angle)
-                                y = center.y + radius * math.sin(angle)
-                                points.append((x, y))
-                            # Close the polygon
-                            points.append(points[0])
-                            
-                            polygon = Polygon(points)
-                            geometries.append(polygon)
+                            center = dxf.center
+                            radius = dxf.radius
+                            # Create circle as polygon by scaling and offsetting the
+                            # precomputed (already closed) unit circle in one step
+                            points = unit_circle * radius + (center.x, center.y)
+                            parts.append(points)
                             processed_count += 1
-                            logging.debug(f"Processed CIRCLE at ({center.x}, {center.y}) with radius {radius}")
+                            if debug_enabled:
+                                logging.debug(f"Processed CIRCLE at ({center.x}, {center.y}) with radius {radius}")
                         except Exception as e:
                             logging.warning(f"Error processing CIRCLE: {e}")
                             skipped_count += 1
-                    
-                    else:
-                        skipped_count += 1
-                
-                else:
-                    skipped_count += 1
             
             except Exception as e:
                 skipped_count += 1
-                logging.warning(f"Error processing entity {entity.dxftype()}: {str(e)}")
+                logging.warning(f"Error processing entity {entity_dxf_type}: {str(e)}")
+        
+        geometries = []
+        if point_coords:
+            geometries = shapely.points(np.array(point_coords, dtype=np.float64)).tolist()
         
+        elif parts:
+            # All vertices in one array; indices maps each row to its geometry
+            coords = np.concatenate([np.asarray(part, dtype=np.float64) for part in parts])
+            indices = np.repeat(np.arange(len(parts)), [len(part) for part in parts])
+            
+            if entity_type == "Lines":
+                geometry_array = shapely.linestrings(coords, indices=indices)
+            else:
+                # linearrings closes each ring whose last point doesn't equal the first
+                geometry_array = shapely.polygons(shapely.linearrings(coords, indices=indices))
+            
+            # Only add valid polygons
+            if polygon_positions:
+                is_valid = np.ones(len(geometry_array), dtype=bool)
+                is_valid[polygon_positions] = shapely.is_valid(geometry_array[polygon_positions])
+                invalid_count = len(geometry_array) - int(is_valid.sum())
+                if invalid_count:
+                    geometry_array = geometry_array[is_valid]
+                    processed_count -= invalid_count
+                    skipped_count += invalid_count
+                    logging.warning(f"Skipped {invalid_count} invalid polygons")
+            
+            geometries = geometry_array.tolist()
+        
+        logging.info(f"Candidate entity types for {entity_type}: {entity_type_counts}")
         logging.info(f"Extraction complete: {processed_count} processed, {skipped_count} skipped")
-        logging.info(f"Looking for: {entity_type}")
-        logging.info(f"Entity types in DXF: {entity_type_counts}")
         
         return geometries
     
@@ -692,16 +948,11 @@ class GeometryExtractor:
         Returns:
             tuple: (geometries_list, detected_entity_type)
         """
-        geometries = []
-        processed_count = 0
-        skipped_count = 0
-        
-        # First, detect the primary geometry type
-        geometry_counts = {}
-        for geom in gdf.geometry:
-            if geom is not None and not geom.is_empty:
-                geom_type = geom.geom_type
-                geometry_counts[geom_type] = geometry_counts.get(geom_type, 0) + 1
+        # First, detect the primary geometry type (vectorized count over the
+        # non-null, non-empty geometries)
+        geometry = gdf.geometry
+        valid_geometry = geometry[geometry.notna() & ~geometry.is_empty]
+        geometry_counts = valid_geometry.geom_type.value_counts().to_dict()
         
         if not geometry_counts:
             return [], "Unknown"
@@ -710,67 +961,280 @@ class GeometryExtractor:
         primary_geom_type = max(geometry_counts, key=geometry_counts.get)
         
         # Map to our entity types
-        if primary_geom_type in ['Point', 'MultiPoint']:
-            detected_entity_type = "Points"
-        elif primary_geom_type in ['LineString', 'MultiLineString']:
-            detected_entity_type = "Lines"
-        elif primary_geom_type in ['Polygon', 'MultiPolygon']:
-            detected_entity_type = "Polygons/Areas"
-        else:
-            detected_entity_type = "Unknown"
+        detected_entity_type = GeometryExtractor.entity_type_for_geometry(primary_geom_type)
         
         logging.info(f"Auto-detected entity type: {detected_entity_type} (primary: {primary_geom_type})")
         
-        # Extract geometries based on detected type
-        for idx, geom in enumerate(gdf.geometry):
+        # Extract geometries for the whole array at once
+        geometries, skipped_count = GeometryExtractor.split_shp_geometries(geometry.to_numpy())
+        processed_count = len(geometries)
+        
+        logging.info(f"Extraction complete: {processed_count} processed, {skipped_count} skipped")
+        return geometries, detected_entity_type
+    
+    @staticmethod
+    def entity_type_for_geometry(geom_type):
+        """
+        Map a geometry type name to the matching DXF entity type
+        
+        Args:
+            geom_type: Geometry type name, e.g. 'MultiPolygon' or 'Point Z'
+        
+        Returns:
+            str: 'Points', 'Lines', 'Polygons/Areas' or 'Unknown'
+        """
+        # Drop any dimension suffix (' Z', ' M', ' ZM') of layer geometry types
+        base_type = geom_type.split()[0] if geom_type else ''
+        
+        if base_type in ['Point', 'MultiPoint']:
+            return "Points"
+        elif base_type in ['LineString', 'MultiLineString']:
+            return "Lines"
+        elif base_type in ['Polygon', 'MultiPolygon']:
+            return "Polygons/Areas"
+        return "Unknown"
+    
+    @staticmethod
+    def split_shp_geometries(geoms):
+        """
+        Split shapefile geometries into the single-part geometries converted to DXF
+        
+        Single-part geometries are passed through as-is and multi-part ones are
+        split into their individual parts; coordinates are only read once, when
+        packing DXF entities (polygons contribute their exterior ring only).
+        
+        Args:
+            geoms: Array of Shapely geometries, may contain None and empty ones
+        
+        Returns:
+            tuple: (geometries_list, skipped_count)
+        """
+        import shapely
+        
+        geometry_type = shapely.GeometryType
+        convertible_types = [geometry_type.POINT, geometry_type.LINESTRING, geometry_type.POLYGON,
+                             geometry_type.MULTIPOINT, geometry_type.MULTILINESTRING,
+                             geometry_type.MULTIPOLYGON]
+        # Missing geometries have type id -1, so they are never supported
+        supported = np.isin(shapely.get_type_id(geoms), convertible_types) & ~shapely.is_empty(geoms)
+        geometries = shapely.get_parts(geoms[supported]).tolist()
+        
+        return geometries, len(geoms) - int(supported.sum())
+
+class ConverterEngine:
+    """Core conversion logic separated from GUI"""
+    
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def get_mga_crs(datum, zone):
+        """
+        Build the CRS for an MGA zone, once per datum/zone pair
+        
+        Args:
+            datum: Coordinate datum ('GDA1994' or 'GDA2020')
+            zone: MGA zone number
+        
+        Returns:
+            pyproj.CRS object
+        """
+        from pyproj import CRS
+        
+        base_epsg = (Config.GDA1994_BASE_EPSG if datum == "GDA1994" 
+                    else Config.GDA2020_BASE_EPSG)
+        return CRS.from_epsg(base_epsg + int(zone))
+    
+    @staticmethod
+    def pack_dxf_entities(geometries):
+        """
+        Convert Shapely geometries into plain DXF entity records
+        
+        Vertex packing is kept separate from entity creation so the
+        modelspace can be filled in a single pass afterwards.
+        
+        Args:
+            geometries: List of Point, LineString and Polygon geometries
+        
+        Returns:
+            list: (dxftype, vertices, closed) tuples where dxftype is
+                  'POINT', 'LWPOLYLINE' or 'POLYLINE'
+        """
+        import shapely
+        
+        entities = []
+        if not len(geometries):
+            return entities
+        
+        geoms = np.asarray(geometries, dtype=object)
+        type_ids = shapely.get_type_id(geoms)
+        
+        # Polygons contribute their exterior ring only
+        parts = geoms.copy()
+        is_polygon = type_ids == shapely.GeometryType.POLYGON
+        parts[is_polygon] = shapely.get_exterior_ring(geoms[is_polygon])
+        has_z = shapely.has_z(parts)
+        
+        # Copy every vertex into one float64 array in a single call; each
+        # geometry's rows are found from cumulative vertex counts. The Z
+        # column is only requested when some geometry actually has Z, so
+        # 2D shapefiles get an (N, 2) array with no NaN-filled Z column
+        coords = shapely.get_coordinates(parts, include_z=bool(has_z.any()))
+        counts = shapely.get_num_coordinates(parts)
+        ends = np.cumsum(counts)
+        starts = ends - counts
+        
+        # Per-geometry values as plain Python lists, which are much cheaper to
+        # index inside the loop than NumPy arrays
+        per_geometry = zip(type_ids.tolist(), has_z.tolist(), starts.tolist(), ends.tolist())
+        
+        # Type ids as plain ints, resolved once instead of through the
+        # GeometryType enum on every geometry
+        point_type = int(shapely.GeometryType.POINT)
+        linestring_type = int(shapely.GeometryType.LINESTRING)
+        polygon_type = int(shapely.GeometryType.POLYGON)
+        
+        for i, (type_id, is_3d, start, end) in enumerate(per_geometry):
+            if start == end:
+                continue
+            
             try:
-                if geom is None or geom.is_empty:
-                    skipped_count += 1
+                if type_id == point_type:
+                    # Point entity, keeping Z when the shapefile has it
+                    point = coords[start].tolist()
+                    entities.append(('POINT', (point[0], point[1], point[2] if is_3d else 0), False))  # Z=0 for 2D points
                     continue
                 
-                # Handle Points
-                if geom.geom_type == 'Point':
-                    geometries.append(Point(geom.coords[0]))
-                    processed_count += 1
-                elif geom.geom_type == 'MultiPoint':
-                    # Split multi-point into individual points
-                    for point in geom.geoms:
-                        geometries.append(Point(point.coords[0]))
-                        processed_count += 1
-                
-                # Handle Lines
-                elif geom.geom_type == 'LineString':
-                    geometries.append(LineString(geom.coords))
-                    processed_count += 1
-                elif geom.geom_type == 'MultiLineString':
-                    # Split multi-line into individual lines
-                    for line in geom.geoms:
-                        geometries.append(LineString(line.coords))
-                        processed_count += 1
+                # Polyline entity - in a mixed 2D/3D input the 2D geometries get
+                # NaN Z from get_coordinates, so only their X/Y columns are kept
+                vertices = coords[start:end] if is_3d else coords[start:end, :2]
+                # LWPOLYLINE is planar, use a 3D POLYLINE to keep vertex Z
+                dxftype = 'POLYLINE' if is_3d else 'LWPOLYLINE'
                 
-                # Handle Polygons
-                elif geom.geom_type == 'Polygon':
-                    # Only use exterior ring for DXF compatibility
-                    geometries.append(Polygon(geom.exterior.coords))
-                    processed_count += 1
-                elif geom.geom_type == 'MultiPolygon':
-                    # Split multi-polygon into individual polygons
-                    for poly in geom.geoms:
-                        geometries.append(Polygon(poly.exterior.coords))
-                        processed_count += 1
+                if type_id == linestring_type:
+                    entities.append((dxftype, vertices.tolist(), False))
                 
-                else:
-                    skipped_count += 1
+                elif type_id == polygon_type:
+                    # Closed polyline entity
+                    entities.append((dxftype, vertices.tolist(), True))
             
             except Exception as e:
-                skipped_count += 1
-                logging.warning(f"Error processing geometry at index {idx}: {str(e)}")
+                logging.warning(f"Failed to convert geometry {geoms[i]}: {str(e)}")
         
-        logging.info(f"Extraction complete: {processed_count} processed, {skipped_count} skipped")
-        return geometries, detected_entity_type
-
-class ConverterEngine:
-    """Core conversion logic separated from GUI"""
+        return entities
+    
+    @staticmethod
+    def add_dxf_entities(msp, entities):
+        """
+        Add packed entity records to a DXF modelspace
+        
+        Args:
+            msp: DXF modelspace object
+            entities: (dxftype, vertices, closed) tuples from pack_dxf_entities
+        
+        Returns:
+            int: Number of entities added
+        """
+        import ezdxf
+        
+        # Look up the factory methods once rather than per entity. DXF R12
+        # has no LWPOLYLINE entity, so 2D polylines become POLYLINE entities
+        add_point = msp.add_point
+        if msp.doc.dxfversion == ezdxf.const.DXF12:
+            add_lwpolyline = msp.add_polyline2d
+        else:
+            add_lwpolyline = msp.add_lwpolyline
+        add_polyline3d = msp.add_polyline3d
+        add_entity = msp.add_entity
+        
+        # Points after the first one are copies of it with a new location,
+        # which skips setting and validating every default DXF attribute
+        # through the add_point() factory
+        point_template = None
+        
+        for dxftype, vertices, closed in entities:
+            if dxftype == 'POINT':
+                if point_template is None:
+                    point_template = add_point(vertices)
+                else:
+                    point = point_template.copy()
+                    point.dxf.location = vertices
+                    add_entity(point)
+            elif dxftype == 'LWPOLYLINE':
+                # Vertices are plain (x, y) pairs - declaring the format stops
+                # ezdxf matching each one against the default 'xyseb' layout
+                add_lwpolyline(vertices, format='xy', close=closed)
+            else:
+                add_polyline3d(vertices, close=closed)
+        
+        return len(entities)
+    
+    @staticmethod
+    def add_r12_points(writer, geometries):
+        """
+        Stream Point geometries to a DXF R12 file through ezdxf's r12writer
+        
+        No DXF document is built, so there is no per-entity database or
+        handle allocation cost.
+        
+        Args:
+            writer: Open r12writer stream writer
+            geometries: List of Point geometries
+        
+        Returns:
+            int: Number of points written
+        """
+        import shapely
+        
+        # 2D points get NaN Z from get_coordinates; write them at Z=0
+        coords = shapely.get_coordinates(np.asarray(geometries, dtype=object), include_z=True)
+        coords[np.isnan(coords[:, 2]), 2] = 0
+        
+        add_point = writer.add_point
+        for point in coords.tolist():
+            add_point(point)
+        
+        return len(coords)
+    
+    @staticmethod
+    @contextmanager
+    def atomic_output(output_path):
+        """
+        Write an output file through a temporary file next to it
+        
+        The temporary file only replaces output_path once the block completes,
+        so a failed or interrupted write never leaves a truncated output file
+        (or destroys a previous one).
+        
+        Args:
+            output_path: Path of the final output file
+        
+        Yields:
+            str: Temporary path to write to
+        """
+        temp_path = f"{output_path}.tmp"
+        try:
+            yield temp_path
+            os.replace(temp_path, output_path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+    
+    @staticmethod
+    def save_dxf(doc, dxf_path, binary_dxf):
+        """
+        Save a DXF document as binary or ASCII DXF
+        
+        Args:
+            doc: ezdxf document
+            dxf_path: Path to output DXF file
+            binary_dxf: Whether to save as binary DXF
+        """
+        with ConverterEngine.atomic_output(dxf_path) as temp_path:
+            if binary_dxf:
+                # For binary DXF, use saveas with fmt='bin' parameter
+                doc.saveas(temp_path, fmt='bin')
+            else:
+                # For ASCII DXF, use default saveas method
+                doc.saveas(temp_path)
     
     @staticmethod
     def dxf_to_shp(dxf_path, shp_path, datum, zone, entity_type):
@@ -784,35 +1248,59 @@ class ConverterEngine:
             zone: MGA zone number
             entity_type: Type of entities to convert
         """
+        import ezdxf
+        
+        gpd = load_geopandas()
+        
         logging.info(f"Starting DXF to SHP conversion: {dxf_path} -> {shp_path}")
         
         try:
-            # Read DXF file
-            doc = ezdxf.readfile(dxf_path)
-            msp = doc.modelspace()
+            # Stream large DXF files entity by entity to keep memory bounded
+            geometries = None
+            if os.path.getsize(dxf_path) > Config.DXF_STREAM_THRESHOLD:
+                geometries = GeometryExtractor.stream_from_dxf(dxf_path, entity_type)
             
-            # Extract geometries based on entity type
-            geometries = GeometryExtractor.extract_from_dxf(msp, entity_type)
+            if geometries is None:
+                # Read DXF file
+                doc = ezdxf.readfile(dxf_path)
+                msp = doc.modelspace()
+                
+                # Extract geometries based on entity type
+                geometries = GeometryExtractor.extract_from_dxf(msp, entity_type)
             
             if not geometries:
                 raise ValueError(f"No {entity_type} found in the DXF file. "
                                f"Please check the entity type selection or DXF content.")
             
-            # Determine CRS (Coordinate Reference System)
-            base_epsg = (Config.GDA1994_BASE_EPSG if datum == "GDA1994" 
-                        else Config.GDA2020_BASE_EPSG)
-            crs = f"EPSG:{base_epsg + int(zone)}"
+            # Determine CRS (Coordinate Reference System) - built from the
+            # PROJ database only on the first conversion for this datum/zone
+            crs = ConverterEngine.get_mga_crs(datum, zone)
             
             # Create GeoDataFrame with proper CRS
             gdf = gpd.GeoDataFrame(geometry=geometries, crs=crs)
             
-            # Add some basic attributes
-            gdf['id'] = range(1, len(gdf) + 1)
-            gdf['entity_type'] = entity_type
-            gdf['source_file'] = Path(dxf_path).name
+            # Add some basic attributes. The id column is one int32 array and the
+            # constant columns are single-category categoricals (1 byte per row);
+            # the shapefile writer stores them as plain integer/string fields
+            import pandas as pd
+            row_count = len(gdf)
+            constant_codes = np.zeros(row_count, dtype=np.int8)
+            gdf['id'] = np.arange(1, row_count + 1, dtype=np.int32)
+            gdf['entity_type'] = pd.Categorical.from_codes(constant_codes, categories=[entity_type])
+            gdf['source_file'] = pd.Categorical.from_codes(constant_codes, categories=[Path(dxf_path).name])
             
-            # Save to shapefile
-            gdf.to_file(shp_path, driver='ESRI Shapefile')
+            # Save to shapefile. With pyogrio the layer geometry type is declared
+            # up front rather than inferred by scanning every geometry, and the
+            # features go out in one Arrow batch write when pyarrow is available
+            write_options = {}
+            if PYOGRIO_AVAILABLE:
+                write_options = {
+                    'engine': 'pyogrio',
+                    'geometry_type': Config.SHP_GEOMETRY_TYPES[entity_type],
+                    'promote_to_multi': False,
+                    'use_arrow': ARROW_IO_AVAILABLE
+                }
+            gdf.to_file(shp_path, driver='ESRI Shapefile', **write_options)
             
             logging.info(f"Successfully converted {len(geometries)} {entity_type} to {shp_path}")
             return len(geometries)
@@ -837,62 +1325,68 @@ class ConverterEngine:
         Returns:
             tuple: (converted_count, detected_entity_type)
         """
+        import ezdxf
+        
+        gpd = load_geopandas()
+        
         logging.info(f"Starting SHP to DXF conversion: {shp_path} -> {dxf_path}")
         
         try:
-            # Read shapefile
-            gdf = gpd.read_file(shp_path)
+            # Large shapefiles are read and converted one batch at a time
+            if ARROW_IO_AVAILABLE and os.path.getsize(shp_path) > Config.SHP_STREAM_THRESHOLD:
+                return ConverterEngine.shp_to_dxf_streamed(shp_path, dxf_path, dxf_version, binary_dxf)
+            
+            # Read shapefile geometry only - attributes are not written to DXF,
+            # so the .dbf columns are never loaded into memory. With pyogrio
+            # and pyarrow the features arrive in Arrow record batches
+            read_options = {}
+            if PYOGRIO_AVAILABLE:
+                read_options = {'engine': 'pyogrio', 'use_arrow': ARROW_IO_AVAILABLE}
+            gdf = gpd.read_file(shp_path, columns=[], **read_options)
             
             if gdf.empty:
                 raise ValueError("Shapefile is empty or contains no valid geometries")
             
-            # Create new DXF document
-            doc = ezdxf.new(dxf_version)
-            msp = doc.modelspace()
-            
             # Extract geometries with automatic type detection
             geometries, detected_entity_type = GeometryExtractor.extract_from_shp_auto_detect(gdf)
+            # Each stage releases its input as soon as it is done with it, so the
+            # GeoDataFrame, geometry list and packed records are never all held
+            # in memory together with the DXF document
+            del gdf
             
             if not geometries:
                 raise ValueError("No compatible geometries found in the shapefile.")
             
             logging.info(f"Auto-detected geometry type: {detected_entity_type}")
             
-            # Convert geometries to DXF entities
-            converted_count = 0
-            for geom in geometries:
-                try:
-                    if geom.geom_type == 'Point':
-                        # Add point entity
-                        coords = geom.coords[0]
-                        msp.add_point((coords[0], coords[1], 0))  # Add Z=0 for 3D compatibility
-                        converted_count += 1
-                    
-                    elif geom.geom_type == 'LineString':
-                        # Add polyline entity
-                        coords = [(x, y) for x, y in geom.coords]
-                        msp.add_lwpolyline(coords)
-                        converted_count += 1
-                    
-                    elif geom.geom_type == 'Polygon':
-                        # Add closed polyline entity
-                        coords = [(x, y) for x, y in geom.exterior.coords]
-                        msp.add_lwpolyline(coords, dxfattribs={'closed': True})
-                        converted_count += 1
-                
-                except Exception as e:
-                    logging.warning(f"Failed to convert geometry {geom}: {str(e)}")
+            # R12 points skip the DXF document and go straight to disk
+            if detected_entity_type == "Points" and dxf_version == "R12":
+                from ezdxf.addons import r12writer
+                with ConverterEngine.atomic_output(dxf_path) as temp_path, \
+                        r12writer(temp_path, fmt='bin' if binary_dxf else 'asc') as writer:
+                    converted_count = ConverterEngine.add_r12_points(writer, geometries)
+                    # Raised before the block completes, so an existing output
+                    # file is not replaced by an empty one
+                    if converted_count == 0:
+                        raise ValueError("No geometries could be converted to DXF format")
+                logging.info(f"Successfully streamed {converted_count} points to {dxf_path}")
+                return converted_count, detected_entity_type
+            
+            # Create new DXF document
+            doc = ezdxf.new(dxf_version)
+            msp = doc.modelspace()
+            
+            # Pack vertices first, then create all DXF entities in one pass
+            entities = ConverterEngine.pack_dxf_entities(geometries)
+            del geometries
+            converted_count = ConverterEngine.add_dxf_entities(msp, entities)
+            del entities
             
             if converted_count == 0:
                 raise ValueError("No geometries could be converted to DXF format")
             
             # Save DXF file
-            if binary_dxf:
-                # For binary DXF, use saveas with fmt='bin' parameter
-                doc.saveas(dxf_path, fmt='bin')
-            else:
-                # For ASCII DXF, use default saveas method
-                doc.saveas(dxf_path)
+            ConverterEngine.save_dxf(doc, dxf_path, binary_dxf)
             
             logging.info(f"Successfully converted {converted_count} geometries to {dxf_path}")
             return converted_count, detected_entity_type
@@ -900,6 +1394,79 @@ class ConverterEngine:
         except Exception as e:
             logging.error(f"SHP to DXF conversion failed: {str(e)}")
             raise
+    
+    @staticmethod
+    def shp_to_dxf_streamed(shp_path, dxf_path, dxf_version, binary_dxf):
+        """
+        Convert a large Shapefile to DXF one Arrow record batch at a time
+        
+        Only the current batch of geometries is held in memory besides the DXF
+        document (R12 points go straight to disk, so not even that). The
+        geometry type is taken from the layer definition, as a shapefile holds
+        a single geometry type.
+        
+        Args:
+            shp_path: Path to input SHP file
+            dxf_path: Path to output DXF file
+            dxf_version: DXF format version
+            binary_dxf: Whether to save as binary DXF
+            
+        Returns:
+            tuple: (converted_count, detected_entity_type)
+        """
+        import ezdxf
+        import shapely
+        from ezdxf.addons import r12writer
+        from pyogrio.raw import open_arrow
+        
+        with open_arrow(shp_path, columns=[], batch_size=Config.SHP_BATCH_SIZE,
+                        use_pyarrow=True) as (meta, reader):
+            layer_type = meta['geometry_type']
+            detected_entity_type = GeometryExtractor.entity_type_for_geometry(layer_type)
+            if detected_entity_type == "Unknown":
+                raise ValueError("No compatible geometries found in the shapefile.")
+            
+            logging.info(f"Auto-detected geometry type: {detected_entity_type} (layer: {layer_type}), "
+                         f"reading in batches of {Config.SHP_BATCH_SIZE} features")
+            
+            # Each record batch holds the geometries as WKB
+            geometry_column = meta['geometry_name'] or 'wkb_geometry'
+            batches = (shapely.from_wkb(batch.column(geometry_column).to_numpy(zero_copy_only=False))
+                       for batch in reader)
+            
+            converted_count = 0
+            skipped_count = 0
+            if detected_entity_type == "Points" and dxf_version == "R12":
+                with ConverterEngine.atomic_output(dxf_path) as temp_path, \
+                        r12writer(temp_path, fmt='bin' if binary_dxf else 'asc') as writer:
+                    for batch in batches:
+                        geometries, skipped = GeometryExtractor.split_shp_geometries(batch)
+                        converted_count += ConverterEngine.add_r12_points(writer, geometries)
+                        skipped_count += skipped
+                    # Raised before the block completes, so an existing output
+                    # file is not replaced by an empty one
+                    if converted_count == 0:
+                        raise ValueError("No geometries could be converted to DXF format")
+                doc = None
+            else:
+                doc = ezdxf.new(dxf_version)
+                msp = doc.modelspace()
+                for batch in batches:
+                    geometries, skipped = GeometryExtractor.split_shp_geometries(batch)
+                    entities = ConverterEngine.pack_dxf_entities(geometries)
+                    converted_count += ConverterEngine.add_dxf_entities(msp, entities)
+                    skipped_count += skipped
+        
+        logging.info(f"Extraction complete: {converted_count} processed, {skipped_count} skipped")
+        
+        if converted_count == 0:
+            raise ValueError("No geometries could be converted to DXF format")
+        
+        if doc is not None:
+            ConverterEngine.save_dxf(doc, dxf_path, binary_dxf)
+        
+        logging.info(f"Successfully converted {converted_count} geometries to {dxf_path}")
+        return converted_count, detected_entity_type
 
 class ConverterApp:
     """Main GUI application class with improved error handling and user experience"""
@@ -916,6 +1483,13 @@ class ConverterApp:
         # Initialize variables
         self.last_dir = str(Path.home())  # Start from user's home directory
         self.detected_geometry_type = None  # Store detected geometry type for SHP files
+        self._detection_seq = 0  # Identifies the latest shapefile analysis request
+        self._last_shp_input = ""  # SHP input path the current analysis is for
+        self._detection_timer = None  # Pending delayed detection while typing
+        # Running background analysis as (path, seq, callbacks), so a conversion
+        # started meanwhile waits for it instead of reading the file again
+        self._detection_in_flight = None
+        self._detection_labels = None  # Last (text, style) pairs shown in the detection labels
         
         # Set up the GUI
         self.setup_styles()
@@ -959,10 +1533,15 @@ class ConverterApp:
         self.create_dxf_to_shp_tab()
         self.create_about_tab()
     
-    def get_system_specs(self):
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def get_system_specs():
         """
         Get detailed system specifications including CPU and RAM info.
         Returns a dictionary with system specifications.
+        
+        The specs don't change while the application runs, so they are
+        collected once and cached.
         """
         specs = {}
         
@@ -983,17 +1562,17 @@ class ConverterApp:
             # Fallback for Windows: Use wmic commands
             if platform.system() == 'Windows':
                 try:
-                    # Get CPU info
-                    cpu = subprocess.check_output('wmic cpu get name, maxclockspeed', shell=True).decode()
-                    cpu_lines = cpu.strip().split('\n')[1:]  # Skip header
-                    if cpu_lines:
-                        specs['processor'] = cpu_lines[0].strip()
-                    
-                    # Get logical processors count
-                    cpu_count = subprocess.check_output('wmic cpu get NumberOfLogicalProcessors', shell=True).decode()
-                    count_lines = cpu_count.strip().split('\n')[1:]
-                    if count_lines:
-                        specs['cpu_cores'] = count_lines[0].strip()
+                    # Get CPU name, speed and logical processor count in one
+                    # call; the CSV header row names the columns
+                    cpu = subprocess.check_output(
+                        'wmic cpu get Name,MaxClockSpeed,NumberOfLogicalProcessors /format:csv',
+                        shell=True).decode()
+                    cpu_lines = [line.strip() for line in cpu.splitlines() if line.strip()]
+                    if len(cpu_lines) > 1:
+                        cpu_info = dict(zip(cpu_lines[0].split(','), cpu_lines[1].split(',')))
+                        specs['processor'] = cpu_info['Name']
+                        specs['cpu_cores'] = cpu_info['NumberOfLogicalProcessors']
+                        specs['cpu_freq'] = f"{float(cpu_info['MaxClockSpeed']):.2f} MHz"
                     
                     # Get RAM info
                     ram = subprocess.check_output('wmic computersystem get totalphysicalmemory', shell=True).decode()
@@ -1035,6 +1614,7 @@ class ConverterApp:
         self.shp_input_entry.grid(row=1, column=1, padx=5, pady=5, sticky="ew")
         # Bind the entry change event to detect geometry type
         self.shp_input_entry.bind('<KeyRelease>', self.on_shp_input_change)
+        self.shp_input_entry.bind('<FocusOut>', self.on_shp_input_focus_out)
         ttk.Button(main_frame, text="Browse...", style='Browse.TButton',
                   command=self.browse_shp_input_file).grid(row=1, column=2, padx=5, pady=5)
         
@@ -1113,6 +1693,8 @@ class ConverterApp:
         
         self.shp_progress = ttk.Progressbar(main_frame, length=300, mode="indeterminate")
         self.shp_progress.grid(row=7, column=0, columnspan=3, pady=5, sticky="ew")
+        # Controls toggled together while a conversion runs
+        self.shp_conversion_widgets = (self.shp_convert_button, self.shp_progress)
         
         # Configure column weights for responsive layout
         main_frame.columnconfigure(1, weight=1)
@@ -1182,6 +1764,8 @@ class ConverterApp:
         
         self.dxf_progress = ttk.Progressbar(main_frame, length=300, mode="indeterminate")
         self.dxf_progress.grid(row=7, column=0, columnspan=3, pady=5, sticky="ew")
+        # Controls toggled together while a conversion runs
+        self.dxf_conversion_widgets = (self.dxf_convert_button, self.dxf_progress)
         
         # Configure column weights for responsive layout
         main_frame.columnconfigure(1, weight=1)
@@ -1229,8 +1813,22 @@ class ConverterApp:
         text_frame.grid_rowconfigure(0, weight=1)
         text_frame.grid_columnconfigure(0, weight=1)
 
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-       
+        self.started_on = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        
+        # The text (which needs the system specs) is only filled in the first
+        # time the tab is shown, so collecting them doesn't delay startup
+        self.about_populated = False
+        self.notebook.bind('<<NotebookTabChanged>>', self.on_tab_changed)
+    
+    def on_tab_changed(self, event=None):
+        """Fill the about/help text the first time its tab is selected"""
+        if not self.about_populated and self.notebook.select() == str(self.about_tab):
+            self.populate_about_text()
+    
+    def populate_about_text(self):
+        """Insert the application and system information into the about/help tab"""
+        self.about_populated = True
+        
         # Get system specifications
         specs = self.get_system_specs()
         
@@ -1249,7 +1847,7 @@ SUPPORTED FEATURES:
 • Support for Points, Lines, and Polygons/Areas
 • GDA1994 and GDA2020 datum support
 • MGA Zones 50-56 (Australia)
-• Binary and ASCII DXF output formats
+• Binary and ASCII DXF output formats (R12 point layers are streamed to disk)
 • Real-time coordinate reference system detection
 
 ================================================================================
@@ -1285,14 +1883,12 @@ Zone 52: South Australia (west)      Zone 56: New South Wales, Queensland (east)
 Zone 53: South Australia (east)
 
 ================================================================================
-NEW IN VERSION 2.1:
+NEW IN VERSION 2.2:
 ================================================================================
-• Automatic geometry type detection for SHP → DXF conversion
-• Coordinate Reference System (CRS) detection and display
-• Australian datum support (GDA1994, GDA2020) with MGA zone detection
-• Real-time shapefile analysis with CRS information
-• Enhanced user interface with detailed coordinate system feedback
-• Improved error handling and validation
+• DXF R12 output for legacy CAD software (point layers streamed to disk)
+• Large shapefiles converted in batches to keep memory use bounded
+• Faster shapefile reading and writing with pyogrio/pyarrow when installed
+• Shapefile analysis runs in the background without blocking the interface
 
 ================================================================================
 IMPORTANT NOTES:
@@ -1311,6 +1907,7 @@ Dependencies:
 • geopandas (spatial data handling)
 • ezdxf (DXF file processing)
 • shapely (geometry operations)
+• numpy (coordinate array handling)
 
 Log files are created in the application directory with naming pattern:
 converter_YYYYMMDD.log
@@ -1345,7 +1942,7 @@ OS: {platform.system()} {platform.version()}
 Architecture: {platform.machine()}
 Python Version: {sys.version.split()[0]}
 Running on: {platform.node()}
-Started on: {current_time}
+Started on: {self.started_on}
 
 Hardware Information:
 ------------------
@@ -1362,22 +1959,46 @@ Total RAM: {specs.get('ram', 'Unknown')}
     
     def on_shp_input_change(self, event=None):
         """Handle changes to the SHP input field to detect geometry type and CRS"""
+        # Keys that don't edit the path (arrows, Shift, Home, ...) keep the
+        # current analysis instead of resetting and re-running it
+        shp_input = self.shp_input_entry.get().strip()
+        if shp_input == self._last_shp_input:
+            return
+        self._last_shp_input = shp_input
+        
         # Reset detection display when user types
-        self.detected_type_label.config(text="Type to detect...", style='Info.TLabel')
-        self.detected_crs_label.config(text="Analyzing...", style='Info.TLabel')
-        self.detected_details_label.config(text="Analyzing coordinate system...", style='Info.TLabel')
+        self.set_detection_labels(("Type to detect...", 'Info.TLabel'),
+                                  ("Analyzing...", 'Info.TLabel'),
+                                  ("Analyzing coordinate system...", 'Info.TLabel'))
         self.detected_geometry_type = None
+        self._detection_seq += 1  # Discard any analysis still running for the old path
         
         # Schedule detection after a short delay to avoid constant checking while typing
-        if hasattr(self, '_detection_timer'):
+        if self._detection_timer is not None:
             self.root.after_cancel(self._detection_timer)
         
-        self._detection_timer = self.root.after(500, self.detect_shapefile_info_delayed)
+        self._detection_timer = self.root.after(500, self.detect_shapefile_info_delayed, shp_input)
+    
+    def on_shp_input_focus_out(self, event=None):
+        """Run a pending detection right away when the SHP input field loses focus"""
+        if self._detection_timer is not None:
+            self.root.after_cancel(self._detection_timer)
+            self.detect_shapefile_info_delayed()
     
-    def detect_shapefile_info_delayed(self):
+    def detect_shapefile_info_delayed(self, scheduled_path=None):
         """Detect shapefile information after a delay"""
+        self._detection_timer = None
         shp_path = self.shp_input_entry.get().strip()
-        if shp_path and Path(shp_path).exists() and shp_path.lower().endswith('.shp'):
+        if not shp_path:
+            return
+        
+        # The entry was changed again after this detection was scheduled
+        if scheduled_path is not None and shp_path != scheduled_path:
+            return
+        
+        # Check the extension before touching the filesystem, then probe the
+        # file with a single stat
+        if shp_path.lower().endswith('.shp') and os.path.isfile(shp_path):
             self.detect_and_display_shapefile_info(shp_path)
     
     def browse_shp_input_file(self):
@@ -1385,7 +2006,8 @@ Total RAM: {specs.get('ram', 'Unknown')}
         filepath = filedialog.askopenfilename(
             title="Select Shapefile",
             filetypes=Config.SHP_FILETYPES,
-            initialdir=self.last_dir
+            initialdir=self.last_dir,
+            parent=self.root
         )
         
         if filepath:
@@ -1395,7 +2017,8 @@ Total RAM: {specs.get('ram', 'Unknown')}
             if is_valid:
                 self.shp_input_entry.delete(0, tk.END)
                 self.shp_input_entry.insert(0, filepath)
-                self.last_dir = str(Path(filepath).parent)
+                self._last_shp_input = filepath
+                self.last_dir = os.path.dirname(filepath)
                 logging.info(f"Selected SHP input file: {filepath}")
                 
                 # Immediately detect shapefile information
@@ -1403,81 +2026,94 @@ Total RAM: {specs.get('ram', 'Unknown')}
             else:
                 messagebox.showerror("File Error", f"Invalid file selection:\n{message}")
     
-    def detect_and_display_shapefile_info(self, shp_path):
-        """Detect and display both geometry type and CRS information of the selected shapefile"""
+    def detect_and_display_shapefile_info(self, shp_path, on_detected=None):
+        """
+        Detect geometry type and CRS information of the selected shapefile in a worker thread
+        
+        Args:
+            shp_path: Path to the shapefile
+            on_detected: Optional callback run on the UI thread with the
+                         analysis result once it is available
+        """
+        # Only the most recent request is displayed; an older analysis that
+        # finishes later is discarded
+        self._detection_seq += 1
+        detection_seq = self._detection_seq
+        callbacks = [on_detected] if on_detected else []
+        self._detection_in_flight = (shp_path, detection_seq, callbacks)
+        
+        def run_detection():
+            """Read the shapefile in a separate thread so the UI stays responsive"""
+            # An unchanged shapefile that was analyzed before (e.g. after editing
+            # the path and typing it back) is shown without the progress text.
+            # Checking it stats the .shp and .prj files, so it stays off the UI thread.
+            info = GeometryDetector.cached_shapefile_info(shp_path)
+            if info is None:
+                self.root.after(0, lambda: self.show_detection_in_progress(detection_seq))
+                info = GeometryDetector.detect_shapefile_info(shp_path)
+            self.root.after(0, lambda: self.on_shapefile_info_detected(detection_seq, info, callbacks))
+        
+        thread = threading.Thread(target=run_detection, daemon=True)
+        thread.start()
+    
+    def show_detection_in_progress(self, detection_seq):
+        """Show that the shapefile is being read, unless a newer analysis has been requested"""
+        if detection_seq == self._detection_seq:
+            self.set_detection_labels(("Detecting...", 'Info.TLabel'),
+                                      ("Analyzing...", 'Info.TLabel'),
+                                      ("Reading coordinate system information...", 'Info.TLabel'))
+    
+    def on_shapefile_info_detected(self, detection_seq, info, callbacks):
+        """Display a finished shapefile analysis unless a newer one has been requested"""
+        in_flight = self._detection_in_flight
+        if in_flight is not None and in_flight[2] is callbacks:
+            self._detection_in_flight = None
+        
+        if detection_seq == self._detection_seq:
+            self.display_shapefile_info(info)
+        
+        # Callbacks waiting for this analysis run even if it was superseded
+        for on_detected in callbacks:
+            on_detected(info)
+    
+    def display_shapefile_info(self, info):
+        """Display both geometry type and CRS information of the analyzed shapefile"""
         try:
-            # Show detection in progress
-            self.detected_type_label.config(text="Detecting...", style='Info.TLabel')
-            self.detected_crs_label.config(text="Analyzing...", style='Info.TLabel')
-            self.detected_details_label.config(text="Reading coordinate system information...", style='Info.TLabel')
-            self.root.update_idletasks()
-            
-            # Detect shapefile information (geometry + CRS)
-            info = GeometryDetector.detect_shapefile_info(shp_path)
-            
             if info['error']:
                 # Error - display error message
                 self.detected_geometry_type = None
-                self.detected_type_label.config(text=f"✗ Error: {info['error']}", style='Info.TLabel')
-                self.detected_crs_label.config(text="Unknown", style='Info.TLabel')
-                self.detected_details_label.config(text="Could not analyze coordinate system", style='Info.TLabel')
+                self.set_detection_labels((f"✗ Error: {info['error']}", 'Info.TLabel'),
+                                          ("Unknown", 'Info.TLabel'),
+                                          ("Could not analyze coordinate system", 'Info.TLabel'))
                 logging.warning(f"Failed to detect shapefile info: {info['error']}")
                 return
             
             # Display geometry type information
             self.detected_geometry_type = info['readable_name']
             geom_display_text = f"✓ {info['readable_name']} ({info['feature_count']} features)"
-            self.detected_type_label.config(text=geom_display_text, style='Success.TLabel')
+            type_label = (geom_display_text, 'Success.TLabel')
             
             # Display CRS information
             crs_info = info['crs_info']
             if crs_info is None:
-                self.detected_crs_label.config(text="✗ No CRS defined", style='Info.TLabel')
-                self.detected_details_label.config(
-                    text="Warning: Shapefile has no coordinate reference system defined. "
-                         "This may cause issues with coordinate interpretation.", 
-                    style='Info.TLabel'
-                )
-            elif crs_info['is_australian']:
-                # Australian CRS detected
-                if crs_info['projection'] == 'MGA':
-                    crs_display = f"✓ {crs_info['datum']} MGA Zone {crs_info['zone']}"
-                    details_text = (f"Datum: {crs_info['datum']} | "
-                                  f"Projection: {crs_info['projection']} | "
-                                  f"Zone: {crs_info['zone']}")
-                    if crs_info['epsg_code']:
-                        details_text += f" | EPSG: {crs_info['epsg_code']}"
-                    
-                    self.detected_crs_label.config(text=crs_display, style='Success.TLabel')
-                    self.detected_details_label.config(text=details_text, style='Success.TLabel')
-                    
-                    logging.info(f"Australian MGA CRS detected: {crs_info['datum']} Zone {crs_info['zone']}")
-                    
-                else:
-                    # Australian but not MGA
-                    crs_display = f"✓ {crs_info['datum']} ({crs_info['projection']})"
-                    details_text = (f"Datum: {crs_info['datum']} | "
-                                  f"Projection: {crs_info['projection']}")
-                    if crs_info['epsg_code']:
-                        details_text += f" | EPSG: {crs_info['epsg_code']}"
-                    
-                    self.detected_crs_label.config(text=crs_display, style='Success.TLabel')
-                    self.detected_details_label.config(text=details_text, style='Info.TLabel')
+                crs_label = ("✗ No CRS defined", 'Info.TLabel')
+                details_label = ("Warning: Shapefile has no coordinate reference system defined. "
+                                 "This may cause issues with coordinate interpretation.", 'Info.TLabel')
             else:
-                # Non-Australian CRS
-                if crs_info['epsg_code']:
-                    crs_display = f"⚠ Non-Australian (EPSG:{crs_info['epsg_code']})"
-                    details_text = (f"Warning: Non-Australian coordinate system detected. "
-                                  f"EPSG: {crs_info['epsg_code']}. Consider reprojecting to Australian datum.")
-                else:
-                    crs_display = "⚠ Non-Australian CRS"
-                    details_text = (f"Warning: Non-Australian coordinate system detected. "
-                                  f"Consider reprojecting to GDA1994 or GDA2020 MGA.")
-                
-                self.detected_crs_label.config(text=crs_display, style='Info.TLabel')
-                self.detected_details_label.config(text=details_text, style='Info.TLabel')
+                # Australian (MGA or other) or non-Australian CRS, with or
+                # without an EPSG code
+                is_australian = crs_info['is_australian']
+                is_mga = is_australian and crs_info['projection'] == 'MGA'
+                template_key = (is_australian, is_mga, bool(crs_info['epsg_code']))
+                crs_template, crs_style, details_template, details_style = \
+                    Config.CRS_DISPLAY_TEMPLATES[template_key]
+                crs_label = (crs_template.format(**crs_info), crs_style)
+                details_label = (details_template.format(**crs_info), details_style)
                 
-                logging.warning(f"Non-Australian CRS detected: {crs_info}")
+                if not is_australian:
+                    logging.warning(f"Non-Australian CRS detected: {crs_info}")
+            
+            self.set_detection_labels(type_label, crs_label, details_label)
             
             logging.info(f"Shapefile analysis complete: {info['readable_name']}, CRS: {crs_info}")
         
@@ -1485,11 +2121,32 @@ Total RAM: {specs.get('ram', 'Unknown')}
             # Handle unexpected errors
             self.detected_geometry_type = None
             error_msg = f"✗ Analysis failed: {str(e)}"
-            self.detected_type_label.config(text=error_msg, style='Info.TLabel')
-            self.detected_crs_label.config(text="Unknown", style='Info.TLabel')
-            self.detected_details_label.config(text="Could not analyze shapefile", style='Info.TLabel')
+            self.set_detection_labels((error_msg, 'Info.TLabel'),
+                                      ("Unknown", 'Info.TLabel'),
+                                      ("Could not analyze shapefile", 'Info.TLabel'))
             logging.error(f"Shapefile analysis error: {str(e)}")
     
+    def set_detection_labels(self, type_label, crs_label, details_label):
+        """
+        Update the detected shapefile information labels in one step
+        
+        Labels are only reconfigured when something changed since the last
+        update, so re-detecting an unchanged file causes no relayout.
+        
+        Args:
+            type_label: (text, style) for the geometry type label
+            crs_label: (text, style) for the coordinate system label
+            details_label: (text, style) for the details label
+        """
+        labels = (type_label, crs_label, details_label)
+        if labels == self._detection_labels:
+            return
+        self._detection_labels = labels
+        
+        widgets = (self.detected_type_label, self.detected_crs_label, self.detected_details_label)
+        for widget, (text, style) in zip(widgets, labels):
+            widget.config(text=text, style=style)
+    
     def detect_and_display_geometry_type(self, shp_path):
         """Legacy method - now redirects to full shapefile info detection"""
         self.detect_and_display_shapefile_info(shp_path)
@@ -1499,7 +2156,8 @@ Total RAM: {specs.get('ram', 'Unknown')}
         filepath = filedialog.askopenfilename(
             title="Select Input File",
             filetypes=filetypes,
-            initialdir=self.last_dir
+            initialdir=self.last_dir,
+            parent=self.root
         )
         
         if filepath:
@@ -1509,7 +2167,7 @@ Total RAM: {specs.get('ram', 'Unknown')}
             if is_valid:
                 entry_widget.delete(0, tk.END)
                 entry_widget.insert(0, filepath)
-                self.last_dir = str(Path(filepath).parent)
+                self.last_dir = os.path.dirname(filepath)
                 logging.info(f"Selected input file: {filepath}")
             else:
                 messagebox.showerror("File Error", f"Invalid file selection:\n{message}")
@@ -1520,7 +2178,8 @@ Total RAM: {specs.get('ram', 'Unknown')}
             title="Select Output File Location",
             filetypes=filetypes,
             defaultextension=filetypes[0][1].replace("*", ""),
-            initialdir=self.last_dir
+            initialdir=self.last_dir,
+            parent=self.root
         )
         
         if filepath:
@@ -1530,7 +2189,7 @@ Total RAM: {specs.get('ram', 'Unknown')}
             if is_valid:
                 entry_widget.delete(0, tk.END)
                 entry_widget.insert(0, filepath)
-                self.last_dir = str(Path(filepath).parent)
+                self.last_dir = os.path.dirname(filepath)
                 logging.info(f"Selected output file: {filepath}")
             else:
                 messagebox.showerror("Path Error", f"Invalid output path:\n{message}")
@@ -1569,7 +2228,7 @@ Total RAM: {specs.get('ram', 'Unknown')}
             return False, f"Output path error: {message}"
         
         # Check if output file exists and confirm overwrite
-        if Path(output_path).exists():
+        if os.path.exists(output_path):
             response = messagebox.askyesno(
                 "File Exists", 
                 f"The output file already exists:\n{output_path}\n\nDo you want to overwrite it?"
@@ -1598,15 +2257,15 @@ Total RAM: {specs.get('ram', 'Unknown')}
             return
         
         # Disable UI during conversion
-        self.set_conversion_ui_state(False, "dxf_to_shp")
+        self.set_conversion_ui_state(False, self.dxf_conversion_widgets)
         
         def run_conversion():
             """Run the actual conversion in a separate thread"""
             try:
-                logging.info(f"Starting DXF to SHP conversion")
-                logging.info(f"Input: {dxf_path}")
-                logging.info(f"Output: {shp_path}")
-                logging.info(f"Settings: {datum}, Zone {zone}, {entity_type}")
+                logging.info(f"Starting DXF to SHP conversion\n"
+                             f"Input: {dxf_path}\n"
+                             f"Output: {shp_path}\n"
+                             f"Settings: {datum}, Zone {zone}, {entity_type}")
                 
                 # Perform the conversion
                 converted_count = ConverterEngine.dxf_to_shp(
@@ -1628,7 +2287,7 @@ Total RAM: {specs.get('ram', 'Unknown')}
             
             finally:
                 # Re-enable UI
-                self.root.after(0, lambda: self.set_conversion_ui_state(True, "dxf_to_shp"))
+                self.root.after(0, lambda: self.set_conversion_ui_state(True, self.dxf_conversion_widgets))
         
         # Start conversion in separate thread to prevent UI freezing
         thread = threading.Thread(target=run_conversion, daemon=True)
@@ -1651,28 +2310,65 @@ Total RAM: {specs.get('ram', 'Unknown')}
             messagebox.showwarning("Validation Error", error_message)
             return
         
+        # Disable UI during conversion
+        self.set_conversion_ui_state(False, self.shp_conversion_widgets)
+        
+        # A detection still waiting for the typing delay is not needed any more
+        if self._detection_timer is not None:
+            self.root.after_cancel(self._detection_timer)
+            self._detection_timer = None
+        
         # Check if geometry type was detected
         if not self.detected_geometry_type:
-            # Try to detect it now if not already done
-            self.detect_and_display_shapefile_info(shp_path)
+            # Not detected yet (or still running): start the conversion once
+            # the background analysis of this shapefile is done
+            start_conversion = lambda info: self.on_conversion_shapefile_info(
+                info, shp_path, dxf_path, dxf_version, binary_dxf)
             
-            if not self.detected_geometry_type:
-                messagebox.showwarning("Shapefile Analysis Error", 
-                                     "Could not analyze the shapefile. "
-                                     "Please ensure the file is a valid shapefile with supported geometry types.")
-                return
+            in_flight = self._detection_in_flight
+            if (in_flight is not None and in_flight[0] == shp_path
+                    and in_flight[1] == self._detection_seq):
+                # Already being analyzed, e.g. since the input field lost focus
+                in_flight[2].append(start_conversion)
+            else:
+                self.detect_and_display_shapefile_info(shp_path, start_conversion)
+            return
         
-        # Disable UI during conversion
-        self.set_conversion_ui_state(False, "shp_to_dxf")
+        self.start_shp_to_dxf_conversion(shp_path, dxf_path, dxf_version, binary_dxf,
+                                         self.detected_geometry_type)
+    
+    def on_conversion_shapefile_info(self, info, shp_path, dxf_path, dxf_version, binary_dxf):
+        """Start a SHP to DXF conversion that was waiting for the shapefile analysis"""
+        if info['error']:
+            self.set_conversion_ui_state(True, self.shp_conversion_widgets)
+            messagebox.showwarning("Shapefile Analysis Error", 
+                                 "Could not analyze the shapefile. "
+                                 "Please ensure the file is a valid shapefile with supported geometry types.")
+            return
+        
+        self.start_shp_to_dxf_conversion(shp_path, dxf_path, dxf_version, binary_dxf,
+                                         info['readable_name'])
+    
+    def start_shp_to_dxf_conversion(self, shp_path, dxf_path, dxf_version, binary_dxf,
+                                    detected_geometry_type):
+        """
+        Run a validated SHP to DXF conversion in a separate thread
         
+        Args:
+            shp_path: Path to input SHP file
+            dxf_path: Path to output DXF file
+            dxf_version: DXF format version
+            binary_dxf: Whether to save as binary DXF
+            detected_geometry_type: Geometry type found by the shapefile analysis
+        """
         def run_conversion():
             """Run the actual conversion in a separate thread"""
             try:
-                logging.info(f"Starting SHP to DXF conversion")
-                logging.info(f"Input: {shp_path}")
-                logging.info(f"Output: {dxf_path}")
-                logging.info(f"Settings: {dxf_version}, Binary: {binary_dxf}")
-                logging.info(f"Detected geometry type: {self.detected_geometry_type}")
+                logging.info(f"Starting SHP to DXF conversion\n"
+                             f"Input: {shp_path}\n"
+                             f"Output: {dxf_path}\n"
+                             f"Settings: {dxf_version}, Binary: {binary_dxf}\n"
+                             f"Detected geometry type: {detected_geometry_type}")
                 
                 # Perform the conversion with auto-detection
                 converted_count, detected_entity_type = ConverterEngine.shp_to_dxf(
@@ -1696,43 +2392,36 @@ Total RAM: {specs.get('ram', 'Unknown')}
             
             finally:
                 # Re-enable UI
-                self.root.after(0, lambda: self.set_conversion_ui_state(True, "shp_to_dxf"))
+                self.root.after(0, lambda: self.set_conversion_ui_state(True, self.shp_conversion_widgets))
         
         # Start conversion in separate thread to prevent UI freezing
         thread = threading.Thread(target=run_conversion, daemon=True)
         thread.start()
     
-    def set_conversion_ui_state(self, enabled, conversion_type):
+    def set_conversion_ui_state(self, enabled, conversion_widgets):
         """
         Enable or disable UI elements during conversion
         
         Args:
             enabled: True to enable UI, False to disable
-            conversion_type: 'dxf_to_shp' or 'shp_to_dxf'
+            conversion_widgets: (convert button, progress bar) of the conversion tab,
+                                i.e. self.dxf_conversion_widgets or self.shp_conversion_widgets
         """
-        state = "normal" if enabled else "disabled"
+        convert_button, progress = conversion_widgets
         
-        if conversion_type == "dxf_to_shp":
-            self.dxf_convert_button.config(state=state)
-            if enabled:
-                self.dxf_convert_button.config(text="Convert")
-                self.dxf_progress.stop()
-            else:
-                self.dxf_convert_button.config(text="Converting...")
-                self.dxf_progress.start(10)  # Start progress animation
-        
-        elif conversion_type == "shp_to_dxf":
-            self.shp_convert_button.config(state=state)
-            if enabled:
-                self.shp_convert_button.config(text="Convert")
-                self.shp_progress.stop()
-            else:
-                self.shp_convert_button.config(text="Converting...")
-                self.shp_progress.start(10)  # Start progress animation
+        if enabled:
+            convert_button.config(state="normal", text="Convert")
+            progress.stop()
+        else:
+            convert_button.config(state="disabled", text="Converting...")
+            progress.start(Config.PROGRESS_INTERVAL_MS)  # Start progress animation
 
 def main():
     """Main application entry point with error handling"""
     try:
+        # Refuse to start with a shapely version the conversions cannot use
+        check_shapely_version()
+        
         # Create and configure the main window
         root = tk.Tk()
         